@@ -1,6 +1,4 @@
 from flask import Flask
-from dotenv import load_dotenv
-from flask_wtf import CSRFProtect
 import os
 
 
@@ -9,14 +7,46 @@ def create_app():
 
   Loads environment variables from a local .env (development) and
   initializes CSRF protection for WTForms.
+
+  Flask-WTF, python-dotenv and the Vite helpers are imported inside the
+  factory rather than at module top so that simply importing ``app`` stays
+  cheap on serverless cold starts.
   """
-  load_dotenv()
+  # Only probe the filesystem for a .env file when the environment hasn't
+  # already been configured (Cloud Run injects SECRET_KEY via Secret Manager)
+  if not os.environ.get('SECRET_KEY'):
+    from dotenv import load_dotenv
+    load_dotenv()
+
   app = Flask(__name__)
 
   # Configuration - prefer environment-provided SECRET_KEY in production
   app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 
+  # Decide once whether we're in development - templates and the Vite helpers
+  # read this flag instead of checking the environment on every call
+  app.config['VITE_DEV_MODE'] = os.environ.get('FLASK_ENV') == 'development'
+
+  # Templates never change in production, so don't stat() them on every render
+  if not app.config['VITE_DEV_MODE']:
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+
+  # Cache compiled templates on disk so new processes can skip Jinja's
+  # lex/parse/compile step. The Docker image sets JINJA_CACHE_DIR and fills
+  # it at build time, so Cloud Run cold starts load ready-made templates.
+  # With no directory given, Jinja uses a private per-user temp directory
+  # (mode 0700, ownership checked) so other users can't plant cache files -
+  # that mostly helps development restarts.
+  from jinja2 import FileSystemBytecodeCache
+  cache_dir = os.environ.get('JINJA_CACHE_DIR')
+  if cache_dir:
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+  else:
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
   # Initialize CSRF protection (Flask-WTF)
+  from flask_wtf import CSRFProtect
   csrf = CSRFProtect()
   csrf.init_app(app)
 
@@ -24,11 +54,30 @@ def create_app():
   from app import routes
   app.register_blueprint(routes.bp)
 
-  # Register Vite helpers for templates
-  from app.vite_helpers import vite_asset, vite_hmr_client
-  app.jinja_env.globals.update({
-    'vite_asset': vite_asset,
-    'vite_hmr_client': vite_hmr_client,
-  })
+  # Register Vite helpers for templates (and resolve asset URLs in production)
+  from app.vite_helpers import init_vite
+  init_vite(app)
+
+  # The dashboard only varies by greeting, so render it up front in
+  # production (dev mode keeps rendering live so template edits show up)
+  if not app.config['VITE_DEV_MODE']:
+    routes.prerender_dashboard(app)
+
+  # Connect to OpenRouter in the background so requests that arrive after it
+  # finishes don't wait for the TLS handshake. It's opt-in (OPENROUTER_WARMUP=1, set in the Dockerfile)
+  # so development servers and tests don't call OpenRouter just by starting.
+  if os.environ.get('OPENROUTER_WARMUP') == '1':
+    import threading
+    threading.Thread(target=_warm_up_openrouter, daemon=True).start()
 
   return app
+
+
+def _warm_up_openrouter():
+  """Background thread target that pre-connects to OpenRouter.
+
+  The OpenAI SDK is imported here, inside the thread, so its slow import
+  doesn't hold up create_app().
+  """
+  from app.services.openai_client import warm_up_openai_client
+  warm_up_openai_client()
@@ -1,7 +1,26 @@
 from flask_wtf import FlaskForm
-from wtforms import TextAreaField, SelectField, IntegerField, SubmitField
+from wtforms import BooleanField, TextAreaField, SelectField, IntegerField, SubmitField
 from wtforms.validators import DataRequired, NumberRange, Optional
 
+# Allowed answer length range (in words), shared with the JSON stream route
+WORD_COUNT_MIN = 100
+WORD_COUNT_MAX = 400
+WORD_COUNT_DEFAULT = 200
+
+# Select field defaults and options, built once at import time and shared by every form instance
+STRATEGY_DEFAULT = 'option_a'
+MODEL_DEFAULT = 'anthropic/claude-sonnet-4.5'
+STRATEGY_CHOICES = (
+  ('option_a', 'Option A: Good News'),
+  ('option_b', 'Option B: Contrast'),
+)
+MODEL_CHOICES = (
+  ('anthropic/claude-sonnet-4.5', 'Claude Sonnet 4.5'),
+  ('google/gemini-2.5-flash', 'Gemini 2.5 Flash'),
+  ('openai/gpt-5-mini', 'GPT-5 Mini'),
+  ('openai/gpt-5.1', 'GPT-5.1'),
+)
+
 
 class GovernmentQuestionForm(FlaskForm):
   """WTForms form for the Government Question writer.
@@ -9,14 +28,10 @@ class GovernmentQuestionForm(FlaskForm):
   This form is used for server-side validation and to provide a CSRF token
   to the frontend JavaScript when making AJAX requests.
   """
-  word_count = IntegerField('Answer Length', default=200, validators=[NumberRange(min=100, max=400)])
+  word_count = IntegerField('Answer Length', default=WORD_COUNT_DEFAULT, validators=[NumberRange(min=WORD_COUNT_MIN, max=WORD_COUNT_MAX)])
   topic = TextAreaField('Topic / Announcement', validators=[DataRequired()])
   other_instructions = TextAreaField('Other Instructions', validators=[Optional()])
-  strategy = SelectField('Strategy', choices=[('option_a', 'Option A: Good News'), ('option_b', 'Option B: Contrast')], default='option_a')
-  model = SelectField('AI Model', choices=[
-    ('anthropic/claude-sonnet-4.5', 'Claude Sonnet 4.5'),
-    ('google/gemini-2.5-flash', 'Gemini 2.5 Flash'),
-    ('openai/gpt-5-mini', 'GPT-5 Mini'),
-    ('openai/gpt-5.1', 'GPT-5.1'),
-  ], default='anthropic/claude-sonnet-4.5')
+  strategy = SelectField('Strategy', choices=STRATEGY_CHOICES, default=STRATEGY_DEFAULT)
+  model = SelectField('AI Model', choices=MODEL_CHOICES, default=MODEL_DEFAULT)
+  use_cache = BooleanField('Reuse last draft')
   submit = SubmitField('Generate Government Question')
@@ -11,18 +11,135 @@ For Python beginners:
 - We use Blueprint to organize related routes together
 """
 
+import json
 from datetime import datetime
-from flask import Blueprint, render_template, request, Response, stream_with_context
+from types import MappingProxyType
+from flask import Blueprint, current_app, render_template, request, Response
+from werkzeug.datastructures import Headers
 
-# Import our service modules (the business logic)
-from .services.openai_client import check_api_key_configured
-from .services.government_question_service import generate_government_question_stream
-from .forms import GovernmentQuestionForm
+# The service modules (the business logic) are imported inside the stream
+# route instead of here - they pull in the OpenAI SDK, which is slow to import
+from .forms import (
+  GovernmentQuestionForm,
+  MODEL_CHOICES,
+  MODEL_DEFAULT,
+  STRATEGY_CHOICES,
+  STRATEGY_DEFAULT,
+  WORD_COUNT_DEFAULT,
+  WORD_COUNT_MAX,
+  WORD_COUNT_MIN,
+)
 
 # Create a Blueprint - a way to organize related routes
 # Think of it like a mini-application within our main Flask app
 bp = Blueprint('main', __name__)
 
+# Define the modules that will appear on the dashboard
+# This is a tuple of read-only dictionaries - each one represents one module card.
+# It never changes, so we build it once when the module is imported instead of
+# on every request (MappingProxyType stops templates from mutating shared state).
+DASHBOARD_MODULES = (
+  MappingProxyType({
+    "id": "government-question-writer",
+    "title": "Government Question Writer",
+    "description": "Generates questions for Government MPs to ask during Question Time.",
+    "icon": "bi-mic-fill",
+    "color": "primary",
+    "url": "main.government_question_writer"  # Points to the government_question_writer function below
+  }),
+  MappingProxyType({
+    "id": "hot-issues",
+    "title": "Hot Issues Brief Updater",
+    "description": "Scans the latest news to update the daily briefing notes on emerging issues.",
+    "icon": "bi-newspaper",
+    "color": "info",
+    "url": None  # None means not yet implemented - will show "Coming Soon"
+  }),
+)
+
+# Greeting for each hour of the day (index 0 = midnight, 23 = 11pm)
+# Morning is before 12pm, afternoon is 12pm-5pm, evening is 5pm onwards
+GREETINGS_BY_HOUR = ("Good Morning",) * 12 + ("Good Afternoon",) * 5 + ("Good Evening",) * 7
+
+
+# Headers for every Server-Sent Events response, built once at import time.
+# This is a Werkzeug Headers object so Response() can use it as-is instead of
+# converting a dict. Responses modify their headers (e.g. Content-Length), so
+# always pass SSE_HEADERS.copy() rather than the shared object itself.
+SSE_HEADERS = Headers([
+  ('Content-Type', 'text/event-stream'),
+  ('Cache-Control', 'no-cache'),  # Don't cache streaming responses
+  ('X-Accel-Buffering', 'no'),    # Disable buffering in nginx (if used)
+])
+
+
+def format_sse_error(message):
+  """
+  Build a Server-Sent Event carrying an error message as valid JSON.
+
+  Args:
+    message (str): The error message to show the user.
+
+  Returns:
+    bytes: An SSE frame like data: {"error": "..."} followed by a blank line
+  """
+  return f"data: {json.dumps({'error': message})}\n\n".encode('utf-8')
+
+
+# Error events that never change, built once instead of on every request
+SSE_ERROR_NO_TOPIC = format_sse_error('Please provide a topic or announcement.')
+SSE_ERROR_NO_API_KEY = format_sse_error('OpenRouter API key not configured.')
+SSE_ERROR_BAD_JSON = format_sse_error('Invalid request body.')
+SSE_ERROR_BAD_OPTION = format_sse_error('Please choose a strategy and model from the list.')
+
+# The values JSON requests may use - the same ones the form's dropdowns offer
+# (a frozenset makes the "is this allowed?" check a single lookup)
+ALLOWED_STRATEGIES = frozenset(value for value, _label in STRATEGY_CHOICES)
+ALLOWED_MODELS = frozenset(value for value, _label in MODEL_CHOICES)
+
+
+def parse_word_count(value):
+  """
+  Convert a client-supplied word count into a safe integer.
+
+  JSON requests skip WTForms validation, so we apply the same limits as the
+  form here. Anything that isn't a number falls back to the default, and
+  numbers outside the allowed range are clamped to it. This stops a client
+  from asking the AI for a huge (slow and expensive) answer.
+
+  Args:
+    value: The raw word_count value from the request (may be None or a string).
+
+  Returns:
+    int: A word count between WORD_COUNT_MIN and WORD_COUNT_MAX.
+  """
+  try:
+    word_count = int(value)
+  except (TypeError, ValueError, OverflowError):
+    # OverflowError: JSON allows Infinity, which int() can't convert
+    return WORD_COUNT_DEFAULT
+  return max(WORD_COUNT_MIN, min(word_count, WORD_COUNT_MAX))
+
+
+def get_text_field(data, key):
+  """
+  Read an optional text field from a JSON request body, stripped of whitespace.
+
+  Empty or missing values return '' straight away without calling .strip(),
+  and non-string values (e.g. a number sent by a buggy client) are ignored.
+
+  Args:
+    data (dict): The parsed JSON body.
+    key (str): The field name to read.
+
+  Returns:
+    str: The stripped text, or '' if the field is missing or blank.
+  """
+  value = data.get(key)
+  if not value or not isinstance(value, str):
+    return ''
+  return value.strip()
+
 
 def get_greeting():
   """
@@ -36,15 +153,55 @@ def get_greeting():
   For Python beginners:
   - datetime.now() gets the current date and time
   - .hour extracts just the hour (0-23)
-  - We use if/elif/else to choose the right greeting
+  - We use the hour as an index into GREETINGS_BY_HOUR to pick the greeting
   """
-  hour = datetime.now().hour
-  if hour < 12:
-    return "Good Morning"
-  elif hour < 17:
-    return "Good Afternoon"
-  else:
-    return "Good Evening"
+  return GREETINGS_BY_HOUR[datetime.now().hour]
+
+
+def render_dashboard(greeting):
+  """
+  Render the dashboard template for a given greeting.
+
+  Args:
+    greeting (str): One of the values in GREETINGS_BY_HOUR.
+
+  Returns:
+    str: Rendered HTML for the dashboard page
+  """
+  return render_template(
+    'dashboard.html',
+    greeting=greeting,
+    modules=DASHBOARD_MODULES,
+    active_page='dashboard'
+  )
+
+
+def prerender_dashboard(app):
+  """
+  Render every dashboard variant once and store them on the app.
+
+  The only thing that changes on the dashboard is the greeting, and there are
+  only three of those. Rendering them all at startup means index() can skip
+  Jinja entirely and just return a ready-made string.
+
+  Links in the page (url_for, vite_asset) are built for the app's
+  APPLICATION_ROOT (default '/'). We remember that prefix, and index() only
+  serves the pre-rendered page to requests mounted at the same path - if the
+  app is served under a different prefix it falls back to a live render.
+
+  Args:
+    app (Flask): The application to pre-render for. Blueprints and template
+      globals must already be registered.
+  """
+  # test_request_context() uses APPLICATION_ROOT as the script root
+  with app.test_request_context():
+    app.extensions['dashboard'] = {
+      'html': {
+        greeting: render_dashboard(greeting)
+        for greeting in set(GREETINGS_BY_HOUR)
+      },
+      'script_root': request.script_root,
+    }
 
 
 @bp.route('/')
@@ -63,34 +220,16 @@ def index():
   - The function name ('index') doesn't have to match the URL
   - render_template() loads an HTML file and fills in any variables
   """
-  # Define the modules that will appear on the dashboard
-  # This is a list of dictionaries - each dict represents one module card
-  modules = [
-    {
-      "id": "government-question-writer",
-      "title": "Government Question Writer",
-      "description": "Generates questions for Government MPs to ask during Question Time.",
-      "icon": "bi-mic-fill",
-      "color": "primary",
-      "url": "main.government_question_writer"  # Points to the government_question_writer function below
-    },
-    {
-      "id": "hot-issues",
-      "title": "Hot Issues Brief Updater",
-      "description": "Scans the latest news to update the daily briefing notes on emerging issues.",
-      "icon": "bi-newspaper",
-      "color": "info",
-      "url": None  # None means not yet implemented - will show "Coming Soon"
-    }
-  ]
+  greeting = get_greeting()
+
+  # Serve the pre-rendered page if create_app() built one (production only)
+  # and its links were built for the path prefix this request arrived on
+  prerendered = current_app.extensions.get('dashboard')
+  if prerendered and request.script_root == prerendered['script_root']:
+    return prerendered['html'][greeting]
 
   # Render the template and pass in our data
-  return render_template(
-    'dashboard.html',
-    greeting=get_greeting(),
-    modules=modules,
-    active_page='dashboard'
-  )
+  return render_dashboard(greeting)
 
 
 @bp.route('/government-question-writer')
@@ -118,65 +257,78 @@ def government_question_writer_stream():
   - This is how ChatGPT shows responses appearing word-by-word
   """
   # Accept either JSON (AJAX) or regular form submissions (WTForms)
-  data = None
-  form = GovernmentQuestionForm()
-
   if request.is_json:
-    data = request.get_json()
-    word_count = int(data.get('word_count', 200))
-    topic = data.get('topic', '').strip()
-    other_instructions = data.get('other_instructions', '').strip()
-    strategy = data.get('strategy', 'option_a')
-    model = data.get('model', 'anthropic/claude-sonnet-4.5')
+    # silent=True returns None for malformed JSON instead of raising a 400,
+    # and cache=False skips keeping a copy on the request since we only read it once
+    data = request.get_json(silent=True, cache=False)
+    if not isinstance(data, dict):
+      return Response(SSE_ERROR_BAD_JSON, headers=SSE_HEADERS.copy())
+
+    word_count = parse_word_count(data.get('word_count'))
+    topic = get_text_field(data, 'topic')
+    other_instructions = get_text_field(data, 'other_instructions')
+    strategy = data.get('strategy') or STRATEGY_DEFAULT
+    model = data.get('model') or MODEL_DEFAULT
+
+    # Replaying a saved draft is opt-in (the "Reuse last draft" checkbox) -
+    # by default every "Generate" click asks the AI for a fresh version
+    use_cache = data.get('use_cache') is True
 
     if not topic:
-      return Response(
-        f"data: {{'error': 'Please provide a topic or announcement.'}}\n\n",
-        mimetype='text/event-stream'
-      )
+      return Response(SSE_ERROR_NO_TOPIC, headers=SSE_HEADERS.copy())
+
+    # JSON skips the form's dropdown validation, so check the choices here.
+    # The isinstance() check comes first because lists or dicts can't be
+    # looked up in a set (they'd raise a TypeError).
+    if not (isinstance(strategy, str) and strategy in ALLOWED_STRATEGIES
+            and isinstance(model, str) and model in ALLOWED_MODELS):
+      return Response(SSE_ERROR_BAD_OPTION, headers=SSE_HEADERS.copy())
   else:
-    # Validate WTForms submission (includes CSRF check)
+    # Only build the form for non-JSON posts - FlaskForm would otherwise
+    # parse the JSON body a second time to use as form data.
+    # CSRFProtect (set up in create_app) has already checked the token for
+    # every POST before we get here, so the form doesn't need to check it again.
+    form = GovernmentQuestionForm(meta={'csrf': False})
+
+    # Validate WTForms submission
     if not form.validate_on_submit():
       # Build a friendly error message from form errors
       errors = []
       for field, msgs in form.errors.items():
         errors.append(f"{field}: {', '.join(msgs)}")
       error_msg = '; '.join(errors) or 'Invalid form submission.'
-      return Response(
-        f"data: {{'error': '{error_msg}'}}\n\n",
-        mimetype='text/event-stream'
-      )
+      return Response(format_sse_error(error_msg), headers=SSE_HEADERS.copy())
 
-    word_count = int(form.word_count.data or 200)
+    word_count = int(form.word_count.data or WORD_COUNT_DEFAULT)
     topic = (form.topic.data or '').strip()
     other_instructions = (form.other_instructions.data or '').strip()
-    strategy = form.strategy.data or 'option_a'
-    model = form.model.data or 'anthropic/claude-sonnet-4.5'
+    strategy = form.strategy.data or STRATEGY_DEFAULT
+    model = form.model.data or MODEL_DEFAULT
+    use_cache = bool(form.use_cache.data)
+
+  # Python only runs an import once per process - after the first request
+  # these lines are just a quick lookup in sys.modules
+  from .services.openai_client import check_api_key_configured
+  from .services.government_question_service import generate_government_question_stream
 
   if not check_api_key_configured():
-    return Response(
-      f"data: {{'error': 'OpenRouter API key not configured.'}}\n\n",
-      mimetype='text/event-stream'
-    )
+    return Response(SSE_ERROR_NO_API_KEY, headers=SSE_HEADERS.copy())
 
   # Call the streaming service function
-  # This returns a generator that yields SSE-formatted strings
+  # This returns a generator that yields SSE-formatted bytes
   stream = generate_government_question_stream(
     topic=topic,
     other_instructions=other_instructions,
     word_count=word_count,
     strategy=strategy,
-    model=model
+    model=model,
+    use_cache=use_cache
   )
 
   # Return the stream as a Response
-  # stream_with_context() ensures the stream has access to Flask's request context
-  # mimetype='text/event-stream' tells the browser this is SSE
-  return Response(
-    stream_with_context(stream),
-    mimetype='text/event-stream',
-    headers={
-      'Cache-Control': 'no-cache',  # Don't cache streaming responses
-      'X-Accel-Buffering': 'no'     # Disable buffering in nginx (if used)
-    }
-  )
+  # The service only uses the arguments we pass in, so we don't wrap it in
+  # stream_with_context() - that would keep the whole request alive for the
+  # many seconds it takes the AI to finish answering
+  # SSE_HEADERS sets Content-Type: text/event-stream, which tells the browser this is SSE
+  # direct_passthrough=True because the service already yields encoded bytes
+  return Response(stream, headers=SSE_HEADERS.copy(), direct_passthrough=True)
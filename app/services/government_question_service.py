@@ -1,5 +1,10 @@
 import json
-from typing import Dict, Generator
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Generator, Optional, Tuple, cast
+from openai.types.chat import ChatCompletionSystemMessageParam
 from .openai_client import get_openai_client
 
 
@@ -53,6 +58,70 @@ Use these exact headers:
 """
 
 
+# OpenRouter only honours explicit cache_control breakpoints for these providers.
+# OpenAI models cache long prompts automatically, so they get the plain form.
+PROMPT_CACHING_MODEL_PREFIXES = ("anthropic/", "google/")
+
+# The system message is the same on every request, so both forms are built
+# once here and reused rather than creating new dicts for each call
+SYSTEM_MESSAGE: ChatCompletionSystemMessageParam = {"role": "system", "content": government_question_SYSTEM_PROMPT}
+# cast() because the SDK's type hints don't know about OpenRouter's cache_control field
+CACHED_SYSTEM_MESSAGE = cast(ChatCompletionSystemMessageParam, {
+  "role": "system",
+  "content": [
+    {
+      "type": "text",
+      "text": government_question_SYSTEM_PROMPT,
+      "cache_control": {"type": "ephemeral"},
+    }
+  ],
+})
+
+
+def build_system_message(model: str) -> ChatCompletionSystemMessageParam:
+  """
+  Build the system message for the chat request.
+
+  The system prompt is identical on every request, so for providers that
+  support it we mark it as cacheable. The provider then reuses its processed
+  copy of the prompt instead of reading it from scratch each time, which makes
+  the first words of the answer arrive sooner and costs less.
+
+  Args:
+    model (str): The OpenRouter model id, e.g. "anthropic/claude-sonnet-4.5".
+
+  Returns:
+    ChatCompletionSystemMessageParam: A chat message with role "system". This is a shared object, so
+      don't modify it.
+  """
+  if model.startswith(PROMPT_CACHING_MODEL_PREFIXES):
+    return CACHED_SYSTEM_MESSAGE
+  return SYSTEM_MESSAGE
+
+
+# Strategy display text and short name, keyed by the form value
+STRATEGY_TEXT = {
+  "option_a": ("Option A: Good News (Positive)", "Option A"),
+  "option_b": ("Option B: Contrast (Attack)", "Option B"),
+}
+
+OTHER_INSTRUCTIONS_TEMPLATE = "\n\n**Additional Instructions:** {other_instructions}"
+
+# The user prompt never changes shape, so we keep it as a template and fill
+# in the blanks with str.format() instead of rebuilding an f-string each time
+USER_PROMPT_TEMPLATE = """Please draft a Dorothy Dixer question and ministerial answer with the following details:
+
+**Topic/Announcement:** {topic}
+
+**Strategy:** {strategy_text}
+
+**Target Answer Length:** Approximately {word_count} words for the answer (the question can be shorter, but aim for around {word_count} words in the Minister's answer, do NOT go over).
+
+{other_instructions_text}
+
+Generate a parliamentary question following the {strategy_name} structure, and a Minister Collins-style answer."""
+
+
 def build_user_prompt(
   topic: str,
   word_count: int,
@@ -78,33 +147,28 @@ def build_user_prompt(
   - Args: means "arguments" - the inputs this function needs
   - Optional[str] means the value can be a string or None (missing)
   - The -> str part tells you this function returns a string
-  - f-strings (f"...") let you insert variables into strings using {variable}
+  - str.format() fills in the {placeholders} in a template string
   """
-  # Determine which strategy text to show
-  strategy_text = (
-    "Option A: Good News (Positive)"
-    if strategy == "option_a"
-    else "Option B: Contrast (Attack)"
+  # Look up the strategy text (anything other than option_a is treated as option_b)
+  strategy_text, strategy_name = STRATEGY_TEXT.get(strategy, STRATEGY_TEXT["option_b"])
+
+  other_instructions_text = "" if not other_instructions else OTHER_INSTRUCTIONS_TEMPLATE.format(other_instructions=other_instructions)
+
+  # Fill in the blanks in the prompt template
+  return USER_PROMPT_TEMPLATE.format(
+    topic=topic,
+    strategy_text=strategy_text,
+    strategy_name=strategy_name,
+    word_count=word_count,
+    other_instructions_text=other_instructions_text,
   )
 
-  other_instructions_text = "" if not other_instructions else f"\n\n**Additional Instructions:** {other_instructions}"
-
-
-  # Build the final prompt using an f-string
-  # The triple quotes let us write multi-line strings
-  user_prompt = f"""Please draft a Dorothy Dixer question and ministerial answer with the following details:
-
-**Topic/Announcement:** {topic}
-
-**Strategy:** {strategy_text}
-
-**Target Answer Length:** Approximately {word_count} words for the answer (the question can be shorter, but aim for around {word_count} words in the Minister's answer, do NOT go over).
-
-{other_instructions_text}
 
-Generate a parliamentary question following the {strategy_text.split(':')[0]} structure, and a Minister Collins-style answer."""
-
-  return user_prompt
+# Patterns for splitting the AI's response into question and answer.
+# They're compiled once when the module loads rather than on every call.
+# re.DOTALL lets "." match newlines; re.IGNORECASE matches "## Question" too.
+RESPONSE_HEADERS_RE = re.compile(r'##\s*QUESTION\s*(.*?)##\s*ANSWER\s*(.*)', re.DOTALL | re.IGNORECASE)
+RESPONSE_FALLBACK_RE = re.compile(r'question:\s*(.*?)answer:\s*(.*)', re.DOTALL | re.IGNORECASE)
 
 
 def parse_government_question_response(response_text: str) -> Dict[str, str]:
@@ -137,37 +201,32 @@ def parse_government_question_response(response_text: str) -> Dict[str, str]:
   }
 
   # Try to split by the standard headers the AI should use
-  if '## QUESTION' in response_text and '## ANSWER' in response_text:
-    # Split the text at "## ANSWER"
-    parts = response_text.split('## ANSWER')
-
-    # The first part contains "## QUESTION" and the question text
-    question_part = parts[0].replace('## QUESTION', '').strip()
+  # A single regex search finds both headers and captures the text after each
+  match = RESPONSE_HEADERS_RE.search(response_text)
 
-    # The second part (if it exists) is the answer
-    answer_part = parts[1].strip() if len(parts) > 1 else ''
+  if not match:
+    # Fallback: Try "Question: ... Answer: ..." if the AI didn't use headers
+    match = RESPONSE_FALLBACK_RE.search(response_text)
 
-    result['question'] = question_part
-    result['answer'] = answer_part
+  if match:
+    result['question'] = match.group(1).strip()
+    result['answer'] = match.group(2).strip()
   else:
-    # Fallback: Try other common patterns if the AI didn't use headers
-    lower_text = response_text.lower()
-    if 'question:' in lower_text and 'answer:' in lower_text:
-      # Find the positions of these words
-      q_idx = lower_text.find('question:')
-      a_idx = lower_text.find('answer:')
-
-      # Only split if question comes before answer
-      if q_idx < a_idx:
-        result['question'] = response_text[q_idx + 9:a_idx].strip()
-        result['answer'] = response_text[a_idx + 7:].strip()
-    else:
-      # Last resort: treat the whole thing as the answer
-      result['answer'] = response_text
+    # Last resort: treat the whole thing as the answer
+    result['answer'] = response_text
 
   return result
 
 
+# Token limits for the word counts the UI slider can produce (100-400 in steps
+# of 25), worked out once. This is also the place to tune the limit for a
+# particular answer length.
+MAX_TOKENS_BY_WORD_COUNT = {
+  word_count: min(word_count * 2 + 500, 4000)
+  for word_count in range(100, 401, 25)
+}
+
+
 def calculate_max_tokens(word_count: int) -> int:
   """
   Calculate how many tokens to request from the AI based on desired word count.
@@ -187,8 +246,119 @@ def calculate_max_tokens(word_count: int) -> int:
   For Python beginners:
   - min() returns the smaller of two numbers
   - This prevents us from requesting too many tokens (which costs money)
+  - Common word counts are looked up in MAX_TOKENS_BY_WORD_COUNT instead
+  """
+  max_tokens = MAX_TOKENS_BY_WORD_COUNT.get(word_count)
+  if max_tokens is None:
+    max_tokens = min(word_count * 2 + 500, 4000)
+  return max_tokens
+
+
+def format_sse_event(payload: Dict) -> bytes:
+  """
+  Format a JSON payload as a UTF-8 encoded Server-Sent Event.
+
+  We hand the web server bytes rather than str so it doesn't have to
+  encode every chunk itself.
+
+  Args:
+    payload (Dict): The data to send to the browser.
+
+  Returns:
+    bytes: An SSE frame like data: {"chunk": "..."} followed by a blank line.
+  """
+  return f"data: {json.dumps(payload)}\n\n".encode('utf-8')
+
+
+# The fixed parts of a chunk event, already encoded, so format_sse_chunk()
+# only has to JSON-escape and encode the text itself
+SSE_CHUNK_PREFIX = b'data: {"chunk": '
+SSE_CHUNK_SUFFIX = b'}\n\n'
+
+
+def format_sse_chunk(content: str) -> bytes:
+  """
+  Format one piece of streamed text as a Server-Sent Event.
+
+  This produces exactly the same output as format_sse_event({'chunk': content})
+  but skips building and serializing a dict. It runs once per token, so the
+  saving adds up over a long answer.
+
+  Args:
+    content (str): The text the AI just sent.
+
+  Returns:
+    bytes: An SSE frame like data: {"chunk": "..."} followed by a blank line.
+  """
+  # json.dumps() escapes non-ASCII characters (e.g. "ü"), so its
+  # output is plain ASCII and encodes with a straight copy
+  return SSE_CHUNK_PREFIX + json.dumps(content).encode('ascii') + SSE_CHUNK_SUFFIX
+
+
+# Recently generated responses, keyed by every input that affects the prompt.
+# Asking again with identical inputs replays the saved response instead of
+# waiting for (and paying for) another AI call.
+RESPONSE_CACHE_SIZE = 256
+REPLAY_CHUNK_SIZE = 40
+_response_cache: "OrderedDict[Tuple, Dict[str, str]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def get_cached_response(key: Tuple) -> Optional[Dict[str, str]]:
+  """
+  Look up a previously generated response.
+
+  Args:
+    key (Tuple): The request inputs (topic, word count, strategy, etc.).
+
+  Returns:
+    Optional[Dict[str, str]]: The parsed response, or None if we don't have one.
   """
-  return min(word_count * 2 + 500, 4000)
+  with _response_cache_lock:
+    parsed = _response_cache.get(key)
+    if parsed is not None:
+      # Mark as recently used so it's the last to be evicted
+      _response_cache.move_to_end(key)
+    return parsed
+
+
+def store_cached_response(key: Tuple, parsed: Dict[str, str]) -> None:
+  """
+  Remember a generated response, dropping the least recently used one if full.
+
+  Args:
+    key (Tuple): The request inputs (topic, word count, strategy, etc.).
+    parsed (Dict[str, str]): The result of parse_government_question_response().
+  """
+  with _response_cache_lock:
+    _response_cache[key] = parsed
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+      _response_cache.popitem(last=False)
+
+
+def replay_cached_response(parsed: Dict[str, str]) -> Generator[bytes, None, None]:
+  """
+  Stream a saved response back in small pieces, like a live one.
+
+  Args:
+    parsed (Dict[str, str]): A response from get_cached_response().
+
+  Yields:
+    bytes: The same SSE frames generate_government_question_stream() sends.
+  """
+  raw = parsed['raw']
+  for start in range(0, len(raw), REPLAY_CHUNK_SIZE):
+    yield format_sse_chunk(raw[start:start + REPLAY_CHUNK_SIZE])
+  yield format_sse_event({'done': True, 'question': parsed['question'], 'answer': parsed['answer']})
+
+
+# Streamed text is grouped into one event once this many characters are
+# waiting, or this many seconds have passed since the last event.
+# The check runs whenever a chunk arrives, so held text can wait until the
+# next chunk (or the end of the stream) - at most one gap between chunks.
+STREAM_FLUSH_CHARS = 256
+STREAM_FLUSH_INTERVAL = 0.02
 
 
 def generate_government_question_stream(
@@ -196,19 +366,26 @@ def generate_government_question_stream(
   word_count: int,
   strategy: str = "option_a",
   other_instructions: str = "",
-  model: str = "anthropic/claude-sonnet-4.5"
-) -> Generator[str, None, None]:
+  model: str = "anthropic/claude-sonnet-4.5",
+  use_cache: bool = False
+) -> Generator[bytes, None, None]:
   """
   Generate a Government Question with streaming (word-by-word) response.
 
+  With use_cache=True, if the exact same inputs were used recently the saved
+  response is replayed instead of calling the AI again. It's off by default
+  because the AI's answers vary and users usually ask again to get a
+  different version.
+
   Args:
     topic (str): The policy topic or announcement.
     word_count (int): Target word count for the answer.
     strategy (str): "option_a" (positive) or "option_b" (attack).
     model (str): The AI model to use (default: "anthropic/claude-sonnet-4.5").
+    use_cache (bool): Whether to reuse a recent identical response (default: False).
 
   Yields:
-    str: Server-Sent Event (SSE) formatted strings, each containing
+    bytes: UTF-8 encoded Server-Sent Event (SSE) frames, each containing
       a JSON payload with either:
       - {"chunk": "text"} for partial responses
       - {"done": true, "question": "...", "answer": "..."} when complete
@@ -216,6 +393,13 @@ def generate_government_question_stream(
 
   """
   try:
+    cache_key = (topic, word_count, strategy, other_instructions, model)
+    if use_cache:
+      cached = get_cached_response(cache_key)
+      if cached is not None:
+        yield from replay_cached_response(cached)
+        return
+
     # Get the configured AI client
     client = get_openai_client()
 
@@ -235,7 +419,7 @@ def generate_government_question_stream(
     stream = client.chat.completions.create(
       model=model,
       messages=[
-        {"role": "system", "content": government_question_SYSTEM_PROMPT},
+        build_system_message(model),
         {"role": "user", "content": user_prompt}
       ],
       temperature=0.7,
@@ -243,28 +427,65 @@ def generate_government_question_stream(
       stream=True  # This enables streaming!
     )
 
-    # Accumulate the full response as we stream
-    full_response = ""
+    # Collect the pieces of the response as we stream
+    # Appending to a list and joining once at the end avoids building a new,
+    # ever-longer string every time a chunk arrives
+    response_parts = []
+
+    # The AI often sends a few characters at a time. Rather than one network
+    # write per piece, we group pieces that arrive close together into one event.
+    # 'sent_parts' counts how many entries of response_parts have been sent.
+    # last_flush starts at minus infinity so the very first text goes out
+    # straight away instead of waiting for a second chunk.
+    sent_parts = 0
+    pending_chars = 0
+    last_flush = float('-inf')
+
+    # Why the AI stopped - "length" means it ran out of tokens mid-answer
+    finish_reason = None
 
     # Process each chunk as it arrives
     # 'for chunk in stream' loops through each piece the AI sends
     for chunk in stream:
+      if chunk.choices[0].finish_reason:
+        finish_reason = chunk.choices[0].finish_reason
+
       # Check if this chunk has content
       if chunk.choices[0].delta.content:
         content = chunk.choices[0].delta.content
-        full_response += content
-
-        # Send this chunk to the client as a Server-Sent Event
-        # json.dumps() converts our Python dict to JSON format
-        yield f"data: {json.dumps({'chunk': content})}\n\n"
+        response_parts.append(content)
+        pending_chars += len(content)
+
+      # Send what we have once enough text has built up, or enough time has
+      # passed. This runs for every chunk (even ones with no text) so held
+      # text goes out as soon as anything arrives after the interval.
+      if pending_chars:
+        now = time.monotonic()
+        if pending_chars >= STREAM_FLUSH_CHARS or now - last_flush >= STREAM_FLUSH_INTERVAL:
+          # Send the grouped text to the client as a Server-Sent Event
+          # format_sse_chunk() JSON-escapes the text and encodes it
+          yield format_sse_chunk(''.join(response_parts[sent_parts:]))
+          sent_parts = len(response_parts)
+          pending_chars = 0
+          last_flush = now
+
+    # Send anything left over before the final event
+    if sent_parts < len(response_parts):
+      yield format_sse_chunk(''.join(response_parts[sent_parts:]))
 
     # When streaming is complete, parse the full response
-    parsed = parse_government_question_response(full_response)
+    parsed = parse_government_question_response(''.join(response_parts))
+
+    # Save it so ticking "Reuse last draft" with the same inputs can replay it
+    # without an AI call (every fresh draft replaces the saved one). Answers that were
+    # cut off by the token limit aren't saved, so they're never replayed.
+    if parsed['answer'] and finish_reason != 'length':
+      store_cached_response(cache_key, parsed)
 
     # Send the final parsed result
-    yield f"data: {json.dumps({'done': True, 'question': parsed['question'], 'answer': parsed['answer']})}\n\n"
+    yield format_sse_event({'done': True, 'question': parsed['question'], 'answer': parsed['answer']})
 
   except Exception as e:
     # If anything goes wrong, send an error event
     # str(e) converts the error to a string message
-    yield f"data: {json.dumps({'error': str(e)})}\n\n"
+    yield format_sse_event({'error': str(e)})
@@ -10,23 +10,50 @@ For Python beginners:
 - This follows the "separation of concerns" principle - keeping related code together
 """
 
+import functools
 import os
-from openai import OpenAI
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-# Environment variables are a secure way to store API keys and configuration
-# They're stored in a .env file that should NEVER be committed to git
-load_dotenv()
-
-
-def get_openai_client():
+import threading
+from typing import Optional
+import httpx
+from openai import DEFAULT_CONNECTION_LIMITS, DefaultHttpxClient, OpenAI
+
+# Environment variables are a secure way to store API keys and configuration.
+# In development they come from a .env file (which should NEVER be committed to
+# git) - create_app() loads it, so this module just reads os.environ.
+
+# How long (in seconds) an idle connection to OpenRouter stays open for reuse.
+# The SDK's default is only 5 seconds, which would close the connection opened
+# at startup long before the first user arrives.
+KEEPALIVE_EXPIRY = 120.0
+
+# The SDK's own connection limits, with the longer keep-alive.
+# httpx is the HTTP library the OpenAI SDK is built on.
+CONNECTION_LIMITS = httpx.Limits(
+  max_connections=DEFAULT_CONNECTION_LIMITS.max_connections,
+  max_keepalive_connections=DEFAULT_CONNECTION_LIMITS.max_keepalive_connections,
+  keepalive_expiry=KEEPALIVE_EXPIRY,
+)
+
+# The one shared client, created on first use by get_openai_client().
+# The lock makes sure two threads asking at the same moment can't both build one.
+_client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
+
+
+def get_openai_client() -> OpenAI:
   """
   Create and return a configured OpenAI client for OpenRouter.
 
   This function creates a client that connects to OpenRouter instead of OpenAI directly.
   OpenRouter acts as a gateway to multiple AI models (Claude, GPT-4, etc).
 
+  The client is created once and then shared by every request. It holds a pool
+  of open HTTPS connections, so reusing it means later requests skip the TCP and
+  TLS handshake with OpenRouter. Idle connections are kept for
+  KEEPALIVE_EXPIRY seconds rather than the SDK's default of 5. Call
+  ``reset_openai_client()`` to force a fresh client (e.g. after changing the
+  API key, or between tests).
+
   Returns:
     OpenAI: A configured OpenAI client object that can make API calls.
 
@@ -38,7 +65,31 @@ def get_openai_client():
   - A function is a reusable block of code that performs a specific task
   - The 'return' statement sends a value back to whoever called the function
   - Triple-quoted strings are docstrings - they document what the function does
+  - 'global _client' lets the function store the client in the module variable
   """
+  global _client
+
+  # Fast path: the client already exists, so no need to take the lock
+  client = _client
+  if client is not None:
+    return client
+
+  with _client_lock:
+    # Another thread may have created it while we were waiting for the lock
+    if _client is None:
+      _client = _create_openai_client()
+    return _client
+
+
+def reset_openai_client() -> None:
+  """Forget the shared client so the next get_openai_client() call builds a new one."""
+  global _client
+  with _client_lock:
+    _client = None
+
+
+def _create_openai_client() -> OpenAI:
+  """Build a new OpenAI client pointed at OpenRouter (see get_openai_client)."""
   client = OpenAI(
     # base_url tells the client to connect to OpenRouter instead of OpenAI
     base_url="https://openrouter.ai/api/v1",
@@ -46,10 +97,15 @@ def get_openai_client():
     # api_key is read from the OPENROUTER_API_KEY environment variable
     # os.getenv() returns the value, or "" (empty string) if it doesn't exist
     api_key=os.getenv("OPENROUTER_API_KEY", ""),
+
+    # http_client holds the connection pool - we only change how long idle
+    # connections are kept, everything else is the SDK's default
+    http_client=DefaultHttpxClient(limits=CONNECTION_LIMITS),
   )
   return client
 
 
+@functools.lru_cache(maxsize=1)
 def check_api_key_configured():
   """
   Check if the OpenRouter API key is configured.
@@ -58,6 +114,10 @@ def check_api_key_configured():
   trying to make requests. It's better to check early and give a clear
   error message than to fail later with a confusing error.
 
+  The result is cached for the lifetime of the process, since the
+  environment doesn't change between requests. Call
+  ``check_api_key_configured.cache_clear()`` if you change the key at runtime.
+
   Returns:
     bool: True if the API key is set, False otherwise.
 
@@ -68,7 +128,37 @@ def check_api_key_configured():
   For Python beginners:
   - 'bool' means boolean - a value that's either True or False
   - We use this kind of check to validate prerequisites before proceeding
+  - @functools.lru_cache remembers the return value so the check only runs once
   """
   api_key = os.getenv("OPENROUTER_API_KEY", "")
   # This returns True if api_key has a value, False if it's empty
   return bool(api_key)
+
+
+def warm_up_openai_client() -> None:
+  """
+  Open a connection to OpenRouter before the first real request needs it.
+
+  Connecting to OpenRouter involves a TCP and TLS handshake that can add a few
+  hundred milliseconds. Making one tiny authenticated call (GET /key, which
+  describes the API key) leaves an open connection in the shared client's
+  pool for the next question generation to reuse.
+
+  This doesn't help a request that is already running when the worker starts
+  (e.g. the one that woke up a Cloud Run instance) - that request opens its
+  own connection at the same time. It helps the requests that come after.
+
+  This is meant to run in a background thread at startup, so any failure is
+  ignored - the real request will simply connect as normal.
+
+  For Python beginners:
+  - 'except Exception' catches any error so a network problem here can't crash the app
+  """
+  if not check_api_key_configured():
+    return
+  try:
+    # cast_to=httpx.Response returns the raw response instead of parsing
+    # it into objects - we only want the connection, not the data
+    get_openai_client().get("/key", cast_to=httpx.Response)
+  except Exception:
+    pass
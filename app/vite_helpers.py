@@ -2,16 +2,95 @@
 
 import os
 import json
-from flask import current_app, url_for
-from typing import Optional
+import threading
+from flask import Flask, current_app, request, url_for
+from typing import Dict, Optional
 
 # Configurable via environment variable for GitHub Codespaces
 VITE_DEV_SERVER_URL = os.environ.get('VITE_DEV_SERVER_URL', 'http://localhost:5173')
 
+# These only depend on VITE_DEV_SERVER_URL, so build them once
+VITE_DEV_URL_PREFIX = f"{VITE_DEV_SERVER_URL}/"
+VITE_HMR_CLIENT_TAG = f'<script type="module" src="{VITE_DEV_SERVER_URL}/@vite/client"></script>'
+
+# Parsed manifest.json files, keyed by static folder path. The manifest only
+# changes when the frontend is rebuilt, which means a redeploy/restart.
+_manifest_cache: Dict[str, dict] = {}
+_manifest_lock = threading.Lock()
+
+
+def load_manifest(static_folder: str) -> dict:
+  """
+  Load the Vite manifest for a static folder, reading it from disk only once.
+
+  Args:
+    static_folder: The Flask app's static folder
+
+  Returns:
+    The parsed manifest, or an empty dict if it is missing or invalid
+  """
+  manifest = _manifest_cache.get(static_folder)
+  if manifest is not None:
+    return manifest
+
+  with _manifest_lock:
+    # Another thread may have loaded it while we were waiting for the lock
+    manifest = _manifest_cache.get(static_folder)
+    if manifest is None:
+      manifest_path = os.path.join(static_folder, 'dist', '.vite', 'manifest.json')
+      try:
+        with open(manifest_path, 'r') as f:
+          manifest = json.load(f)
+      except (FileNotFoundError, json.JSONDecodeError):
+        manifest = {}
+      _manifest_cache[static_folder] = manifest
+
+  return manifest
+
+
+def init_vite(app: Flask) -> None:
+  """
+  Register the Vite template helpers and pre-resolve production asset URLs.
+
+  Looking every manifest entry up once at startup means vite_asset() is a
+  single dict lookup per call, instead of going through the manifest and
+  url_for() each time a template references an asset.
+
+  The URLs are stored on the app itself (in app.extensions['vite']) so that
+  several apps in one process - e.g. a dev app and a production app in
+  tests - never see each other's URLs.
+
+  Args:
+    app: The Flask app (VITE_DEV_MODE must already be set in its config)
+  """
+  app.jinja_env.globals.update({
+    'vite_asset': vite_asset,
+    'vite_hmr_client': vite_hmr_client,
+  })
+
+  # Production asset URLs keyed by source path
+  # (e.g. 'main.ts' -> '/static/dist/assets/main-1a2b3c.js')
+  asset_urls: Dict[str, str] = {}
+  app.extensions['vite'] = {'asset_urls': asset_urls, 'script_root': ''}
+
+  # Dev mode serves assets from the Vite dev server, so there's nothing to resolve
+  if app.config['VITE_DEV_MODE'] or not app.static_folder:
+    return
+
+  manifest = load_manifest(app.static_folder)
+  with app.test_request_context():
+    # The URLs include the path the app is mounted at (SCRIPT_NAME), so
+    # remember it - requests under a different prefix resolve URLs live
+    app.extensions['vite']['script_root'] = request.script_root
+    for asset_path, entry in manifest.items():
+      file_path = entry.get('file')
+      if file_path:
+        asset_urls[asset_path] = url_for('static', filename=f'dist/{file_path}')
+
 
 def is_vite_dev_mode() -> bool:
-  """Check if running in Vite development mode."""
-  return current_app.config.get('VITE_DEV_MODE', os.environ.get('FLASK_ENV') == 'development')
+  """Check if running in Vite development mode (set once in create_app)."""
+  return current_app.config['VITE_DEV_MODE']
 
 
 def vite_asset(asset_path: str) -> str:
@@ -24,27 +103,31 @@ def vite_asset(asset_path: str) -> str:
   Returns:
     Full URL to asset
   """
-  if is_vite_dev_mode():
-    return f"{VITE_DEV_SERVER_URL}/{asset_path}"
+  # current_app is a proxy that finds the real app on every attribute access,
+  # so look the app up once and use it directly for the rest of the call.
+  # (Flask types current_app as Flask, so pyright doesn't know the proxy method.)
+  app: Flask = current_app._get_current_object()  # type: ignore[attr-defined]
 
-  # Production: Read manifest.json
-  static_folder = current_app.static_folder
-  if not static_folder:
-    return url_for('static', filename=f'dist/{asset_path}')
+  if app.config['VITE_DEV_MODE']:
+    return VITE_DEV_URL_PREFIX + asset_path
 
-  manifest_path = os.path.join(static_folder, 'dist', '.vite', 'manifest.json')
+  # Fast path: URL already worked out by init_vite() for this mount point
+  vite = app.extensions.get('vite')
+  if vite and request.script_root == vite['script_root']:
+    url = vite['asset_urls'].get(asset_path)
+    if url is not None:
+      return url
 
-  try:
-    with open(manifest_path, 'r') as f:
-      manifest = json.load(f)
+  # Production: Look up the hashed filename in manifest.json
+  static_folder = app.static_folder
+  if not static_folder:
+    return url_for('static', filename=f'dist/{asset_path}')
 
-    entry = manifest.get(asset_path)
-    if entry:
-      file_path = entry.get('file')
-      if file_path:
-        return url_for('static', filename=f'dist/{file_path}')
-  except (FileNotFoundError, json.JSONDecodeError):
-    pass
+  entry = load_manifest(static_folder).get(asset_path)
+  if entry:
+    file_path = entry.get('file')
+    if file_path:
+      return url_for('static', filename=f'dist/{file_path}')
 
   # Fallback
   return url_for('static', filename=f'dist/{asset_path}')
@@ -53,5 +136,5 @@ def vite_asset(asset_path: str) -> str:
 def vite_hmr_client() -> Optional[str]:
   """Return Vite HMR client script tag in dev mode."""
   if is_vite_dev_mode():
-    return f'<script type="module" src="{VITE_DEV_SERVER_URL}/@vite/client"></script>'
+    return VITE_HMR_CLIENT_TAG
   return None
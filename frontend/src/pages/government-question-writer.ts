@@ -152,6 +152,7 @@ class GovernmentQuestionWriter {
       other_instructions: (document.getElementById('other_instructions') as HTMLTextAreaElement).value,
       strategy: (document.getElementById('strategy') as HTMLSelectElement).value,
       model: (document.getElementById('model') as HTMLSelectElement).value,
+      use_cache: (document.getElementById('use_cache') as HTMLInputElement).checked,
     };
 
     try {
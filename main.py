@@ -4,9 +4,13 @@ from app import create_app
 app = create_app()
 
 if __name__ == "__main__":
-  # Configure Vite dev mode based on Flask environment
-  app.config['VITE_DEV_MODE'] = os.environ.get('FLASK_ENV') == 'development'
+  # Only enable the debugger/reloader in development - it allows running
+  # arbitrary code from the browser, so it must never be on in production
+  debug = os.environ.get('FLASK_ENV') == 'development'
 
   # Use PORT environment variable for Cloud Run compatibility
   port = int(os.environ.get('PORT', 5000))
-  app.run(debug=True, host='0.0.0.0', port=port)
+
+  # threaded=True lets the dev server handle several streams at once.
+  # In production use Gunicorn instead (see Dockerfile).
+  app.run(debug=debug, host='0.0.0.0', port=port, threaded=True)